@@ -7,70 +7,359 @@ introspection JSON file. Outputs schema.graphql (SDL) for ariadne-codegen.
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import shutil
 from pathlib import Path
-from typing import Any, cast
-from urllib.request import Request, urlopen
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
-from graphql import IntrospectionQuery, build_client_schema, get_introspection_query, print_schema
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from graphql import IntrospectionQuery, ValueNode
+
+try:
+    import orjson
+except ImportError:  # Optional speedup — fall back to stdlib json
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
 
 PIPE_URL = "https://pipe.deezer.com/api"
 SCHEMA_JSON = Path("schema.json")
 SCHEMA_GRAPHQL = Path("schema.graphql")
+FETCH_CHUNK_SIZE = 64 * 1024
+
+# Type kinds that wrap another type via ofType
+_WRAPPER_KINDS = frozenset({"NON_NULL", "LIST"})
+# Type kinds that can implement interfaces
+_COMPOSITE_KINDS = frozenset({"OBJECT", "INTERFACE"})
+# Built-in scalars and directives that print_schema leaves out of the SDL
+_SPECIFIED_SCALARS = frozenset({"String", "Int", "Float", "Boolean", "ID"})
+_SPECIFIED_DIRECTIVES = frozenset({"include", "skip", "deprecated", "specifiedBy", "oneOf"})
+_DEFAULT_DEPRECATION_REASON = "No longer supported"
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize an object to compact JSON bytes, using orjson when available."""
+    if HAS_ORJSON:
+        result: bytes = orjson.dumps(obj)
+        return result
+    return json.dumps(obj, separators=(",", ":")).encode()
+
 
+def fetch_introspection(dest: Path) -> dict[str, Any]:
+    """
+    Fetch the full introspection result from the Pipe API (no auth required).
+
+    The response is streamed to ``dest`` in chunks instead of being buffered
+    in memory, then parsed back from disk. ``dest`` is only replaced once the
+    response has been validated, so a failed fetch keeps the previous dump.
+    The file keeps the raw ``{"data": ...}`` envelope; read it back with
+    ``load_introspection``.
+    """
+    # Imported lazily: only the --fetch path needs an HTTP client
+    from urllib.request import Request, urlopen  # noqa: PLC0415
+
+    from graphql import get_introspection_query  # noqa: PLC0415
 
-def fetch_introspection() -> dict[str, Any]:
-    """Fetch the full introspection result from the Pipe API (no auth required)."""
     query = get_introspection_query(descriptions=True)
-    payload = json.dumps({"query": query}).encode()
+    payload = json_dumps({"query": query})
     req = Request(PIPE_URL, data=payload, headers={"Content-Type": "application/json"})  # noqa: S310
-    with urlopen(req, timeout=30) as resp:  # noqa: S310
-        data: dict[str, Any] = json.loads(resp.read())
-    if "errors" in data:
-        msg = f"Introspection errors: {data['errors']}"
-        raise RuntimeError(msg)
+    partial = dest.with_name(f"{dest.name}.part")
+    try:
+        with urlopen(req, timeout=30) as resp, partial.open("wb") as out:  # noqa: S310
+            shutil.copyfileobj(resp, out, FETCH_CHUNK_SIZE)
+        data: dict[str, Any] = json_loads(partial.read_bytes())
+        if "errors" in data:
+            msg = f"Introspection errors: {data['errors']}"
+            raise RuntimeError(msg)
+        partial.replace(dest)
+    finally:
+        partial.unlink(missing_ok=True)
     result: dict[str, Any] = data["data"]
     return result
 
 
-def fix_type_ref(type_ref: dict[str, Any] | None) -> dict[str, Any] | None:
-    """Recursively fix truncated type wrappers (LIST/NON_NULL missing ofType)."""
-    if type_ref is None:
-        return None
-    if type_ref.get("ofType"):
-        type_ref["ofType"] = fix_type_ref(type_ref["ofType"])
-    elif type_ref["kind"] in ("NON_NULL", "LIST"):
-        type_ref["ofType"] = {"name": "String", "kind": "SCALAR", "ofType": None}
-    return type_ref
+def load_introspection(path: Path) -> dict[str, Any]:
+    """
+    Load an introspection result saved by ``fetch_introspection``.
+
+    Accepts both the bare ``{"__schema": ...}`` result and the
+    ``{"data": {"__schema": ...}}`` wrapper of raw API responses, which is
+    what ``--fetch`` streams to disk.
+    """
+    introspection: dict[str, Any] = json_loads(path.read_bytes())
+    if "data" in introspection and "__schema" in introspection["data"]:
+        introspection = introspection["data"]
+    return introspection
+
+
+def fix_type_ref(type_ref: dict[str, Any] | None) -> None:
+    """
+    Fix truncated type wrappers (LIST/NON_NULL missing ofType) along an ofType chain.
+
+    Patches the innermost wrapper in place; intact chains are only read, never written.
+    """
+    while type_ref is not None:
+        child = type_ref.get("ofType")
+        if child:
+            type_ref = child
+            continue
+        if type_ref["kind"] in _WRAPPER_KINDS:
+            type_ref["ofType"] = {"name": "String", "kind": "SCALAR", "ofType": None}
+        break
 
 
 def fix_introspection(introspection: dict[str, Any]) -> None:
     """Patch incomplete types from shallow or truncated introspection results."""
-    # Fix union types missing possibleTypes and object types missing interfaces
-    for t in introspection["__schema"]["types"]:
-        if t["kind"] == "UNION" and not t.get("possibleTypes"):
-            t["possibleTypes"] = []
-        if t["kind"] in ("OBJECT", "INTERFACE") and "interfaces" not in t:
-            t["interfaces"] = []
+    # Local alias: LOAD_FAST instead of a global lookup in the hot loops below
+    fix = fix_type_ref
+    schema = introspection["__schema"]
 
     # Fix truncated type wrappers in directives
-    for d in introspection["__schema"].get("directives", []):
+    for d in schema.get("directives", []):
         for arg in d.get("args", []):
-            fix_type_ref(arg["type"])
+            fix(arg["type"])
+
+    # Single pass over all types: fix union types missing possibleTypes, object
+    # types missing interfaces, and truncated type wrappers in fields/inputs
+    for t in schema["types"]:
+        kind = t["kind"]
+        if kind == "UNION" and not t.get("possibleTypes"):
+            t["possibleTypes"] = []
+        if kind in _COMPOSITE_KINDS and "interfaces" not in t:
+            t["interfaces"] = []
+
+        fields = t.get("fields")
+        if fields:
+            for field in fields:
+                fix(field["type"])
+                args = field.get("args")
+                if args:
+                    for arg in args:
+                        fix(arg["type"])
+        input_fields = t.get("inputFields")
+        if input_fields:
+            for inp in input_fields:
+                fix(inp["type"])
+
+
+def _render_type_ref(type_ref: dict[str, Any]) -> str:
+    """Render an introspection type reference, e.g. ``[String!]!``."""
+    kind = type_ref["kind"]
+    if kind == "NON_NULL":
+        return f"{_render_type_ref(type_ref['ofType'])}!"
+    if kind == "LIST":
+        return f"[{_render_type_ref(type_ref['ofType'])}]"
+    name: str = type_ref["name"]
+    return name
+
+
+class _LiteralPrinters(NamedTuple):
+    """graphql-core functions the emitter uses to render string and value literals."""
+
+    is_printable_as_block_string: Callable[[str], bool]
+    print_block_string: Callable[[str], str]
+    print_string: Callable[[str], str]
+    parse_value: Callable[[str], ValueNode]
+    print_ast: Callable[[ValueNode], str]
+
+
+@functools.cache
+def _printers() -> _LiteralPrinters:
+    """Import graphql-core's literal printers on first use."""
+    # Imported lazily (and only once) so that --help does not pay for loading graphql-core
+    from graphql import parse_value, print_ast  # noqa: PLC0415
+    from graphql.language.block_string import (  # noqa: PLC0415
+        is_printable_as_block_string,
+        print_block_string,
+    )
+    from graphql.language.print_string import print_string  # noqa: PLC0415
+
+    return _LiteralPrinters(
+        is_printable_as_block_string, print_block_string, print_string, parse_value, print_ast
+    )
+
+
+def _render_string(value: str, *, allow_block: bool = False) -> str:
+    """Render a GraphQL string literal, as a block string if allowed and printable."""
+    printers = _printers()
+    if allow_block and printers.is_printable_as_block_string(value):
+        return printers.print_block_string(value)
+    return printers.print_string(value)
+
+
+def _render_value(literal: str) -> str:
+    """Re-print a GraphQL value literal (e.g. ``[1,2]`` as ``[1, 2]``) the way print_schema does."""
+    printers = _printers()
+    return printers.print_ast(printers.parse_value(literal))
+
+
+def _render_description(item: dict[str, Any], indent: str = "", *, first: bool = True) -> str:
+    """Render the description of a type, field, argument or enum value (if any)."""
+    description = item.get("description")
+    if description is None:
+        return ""
+    literal = _render_string(description, allow_block=True)
+    prefix = f"\n{indent}" if indent and not first else indent
+    return prefix + literal.replace("\n", f"\n{indent}") + "\n"
+
+
+def _render_deprecated(item: dict[str, Any]) -> str:
+    """Render the ``@deprecated`` directive for a deprecated element."""
+    reason = item.get("deprecationReason")
+    if reason is None:
+        return ""
+    if reason == _DEFAULT_DEPRECATION_REASON:
+        return " @deprecated"
+    return f" @deprecated(reason: {_render_string(reason)})"
+
+
+def _render_input_value(value: dict[str, Any]) -> str:
+    """Render an argument or input field as ``name: Type = default``."""
+    decl = f"{value['name']}: {_render_type_ref(value['type'])}"
+    default = value.get("defaultValue")
+    if default is not None:
+        decl += f" = {_render_value(default)}"
+    return decl + _render_deprecated(value)
+
+
+def _render_args(args: list[dict[str, Any]], indent: str = "") -> str:
+    """Render an argument list, one per line if any argument has a description."""
+    if not args:
+        return ""
+    if not any(arg.get("description") for arg in args):
+        return "(" + ", ".join(_render_input_value(arg) for arg in args) + ")"
+    lines = [
+        _render_description(arg, f"  {indent}", first=not i)
+        + f"  {indent}"
+        + _render_input_value(arg)
+        for i, arg in enumerate(args)
+    ]
+    return "(\n" + "\n".join(lines) + f"\n{indent})"
+
+
+def _render_block(items: list[str]) -> str:
+    """Wrap rendered members in braces, or render nothing if there are none."""
+    return " {\n" + "\n".join(items) + "\n}" if items else ""
 
-    # Fix truncated type wrappers in all types
-    for t in introspection["__schema"]["types"]:
-        for field in t.get("fields") or []:
-            fix_type_ref(field["type"])
-            for arg in field.get("args") or []:
-                fix_type_ref(arg["type"])
-        for inp in t.get("inputFields") or []:
-            fix_type_ref(inp["type"])
 
+def _render_type(t: dict[str, Any]) -> str:
+    """Render a named type definition from its introspection dict."""
+    kind = t["kind"]
+    header = _render_description(t)
+    if kind == "SCALAR":
+        header += f"scalar {t['name']}"
+        if t.get("specifiedByURL") is not None:
+            header += f" @specifiedBy(url: {_render_string(t['specifiedByURL'])})"
+        return header
+    if kind in _COMPOSITE_KINDS:
+        header += f"{'type' if kind == 'OBJECT' else 'interface'} {t['name']}"
+        if t.get("interfaces"):
+            header += " implements " + " & ".join(i["name"] for i in t["interfaces"])
+        fields = [
+            _render_description(field, "  ", first=not i)
+            + f"  {field['name']}"
+            + _render_args(field.get("args") or [], "  ")
+            + f": {_render_type_ref(field['type'])}"
+            + _render_deprecated(field)
+            for i, field in enumerate(t.get("fields") or ())
+        ]
+        return header + _render_block(fields)
+    if kind == "UNION":
+        header += f"union {t['name']}"
+        if t.get("possibleTypes"):
+            header += " = " + " | ".join(p["name"] for p in t["possibleTypes"])
+        return header
+    if kind == "ENUM":
+        values = [
+            _render_description(value, "  ", first=not i)
+            + f"  {value['name']}"
+            + _render_deprecated(value)
+            for i, value in enumerate(t.get("enumValues") or ())
+        ]
+        return header + f"enum {t['name']}" + _render_block(values)
+    if kind == "INPUT_OBJECT":
+        inputs = [
+            _render_description(inp, "  ", first=not i) + "  " + _render_input_value(inp)
+            for i, inp in enumerate(t.get("inputFields") or ())
+        ]
+        one_of = " @oneOf" if t.get("isOneOf") else ""
+        return header + f"input {t['name']}{one_of}" + _render_block(inputs)
+    msg = f"Unexpected type kind {kind!r} for {t['name']}"
+    raise ValueError(msg)
 
-def convert_to_sdl(introspection: dict[str, Any]) -> str:
-    """Build a GraphQL schema from introspection and return as SDL string."""
+
+def _render_schema_definition(schema: dict[str, Any]) -> str | None:
+    """Render the ``schema { ... }`` block, omitted when root types use the common names."""
+    roots = {
+        operation: (schema.get(f"{operation}Type") or {}).get("name")
+        for operation in ("query", "mutation", "subscription")
+    }
+    common = {"query": "Query", "mutation": "Mutation", "subscription": "Subscription"}
+    if schema.get("description") is None and all(
+        name is None or name == common[operation] for operation, name in roots.items()
+    ):
+        return None
+    operations = [f"  {operation}: {name}" for operation, name in roots.items() if name]
+    return _render_description(schema) + "schema {\n" + "\n".join(operations) + "\n}"
+
+
+def emit_sdl(introspection: dict[str, Any]) -> str:
+    """
+    Render SDL directly from introspection JSON.
+
+    Produces the same output as graphql-core's ``print_schema`` without first
+    building a ``GraphQLSchema`` object graph from the introspection result.
+    Default values are re-printed but not coerced to their declared types, so
+    a default that print_schema would rewrite (e.g. ``"1"`` for an ``ID``) is
+    kept as given.
+    """
+    schema = introspection["__schema"]
+    parts: list[str] = []
+    schema_definition = _render_schema_definition(schema)
+    if schema_definition is not None:
+        parts.append(schema_definition)
+    for d in schema.get("directives") or ():
+        if d["name"] in _SPECIFIED_DIRECTIVES:
+            continue
+        parts.append(
+            _render_description(d)
+            + f"directive @{d['name']}"
+            + _render_args(d.get("args") or [])
+            + (" repeatable" if d.get("isRepeatable") else "")
+            + " on "
+            + " | ".join(d["locations"])
+        )
+    parts.extend(
+        _render_type(t)
+        for t in schema["types"]
+        if not t["name"].startswith("__") and t["name"] not in _SPECIFIED_SCALARS
+    )
+    return "\n\n".join(parts)
+
+
+def convert_to_sdl(introspection: dict[str, Any], *, via_graphql_core: bool = False) -> str:
+    """
+    Fix up introspection and return it as an SDL string.
+
+    :param via_graphql_core: Build a full schema with graphql-core and print it
+        instead of emitting SDL directly (slower, useful to validate the emitter).
+    """
     fix_introspection(introspection)
+    if not via_graphql_core:
+        return emit_sdl(introspection)
+
+    from graphql import build_client_schema, print_schema  # noqa: PLC0415
+
     schema = build_client_schema(cast("IntrospectionQuery", introspection))
     sdl: str = print_schema(schema)
     return sdl
@@ -84,29 +373,26 @@ def main() -> None:
         action="store_true",
         help="Fetch live introspection from pipe.deezer.com (default: read schema.json)",
     )
+    parser.add_argument(
+        "--via-graphql-core",
+        action="store_true",
+        help="Convert via graphql-core's build_client_schema/print_schema (slower, for validation)",
+    )
     args = parser.parse_args()
 
     if args.fetch:
         print(f"Fetching introspection from {PIPE_URL}...")  # noqa: T201
-        introspection = fetch_introspection()
-        with SCHEMA_JSON.open("w") as f:
-            json.dump(introspection, f)
+        introspection = fetch_introspection(SCHEMA_JSON)
         print(f"Saved introspection to {SCHEMA_JSON}")  # noqa: T201
     else:
-        with SCHEMA_JSON.open() as f:
-            introspection = json.load(f)
-        # Handle {"data": {"__schema": ...}} wrapper from older dumps
-        if "data" in introspection and "__schema" in introspection["data"]:
-            introspection = introspection["data"]
+        introspection = load_introspection(SCHEMA_JSON)
 
-    sdl = convert_to_sdl(introspection)
+    sdl = convert_to_sdl(introspection, via_graphql_core=args.via_graphql_core)
 
-    with SCHEMA_GRAPHQL.open("w") as f:
-        f.write(sdl)
+    SCHEMA_GRAPHQL.write_text(sdl)
 
-    print(  # noqa: T201
-        f"Wrote {SCHEMA_GRAPHQL}: {len(sdl)} chars, {sdl.count(chr(10))} lines"
-    )
+    line_count = sdl.count("\n")
+    print(f"Wrote {SCHEMA_GRAPHQL}: {len(sdl)} chars, {line_count} lines")  # noqa: T201
 
 
 if __name__ == "__main__":
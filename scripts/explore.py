@@ -8,6 +8,9 @@ Usage::
     # Run a .graphql file
     uv run python scripts/explore.py queries/get_me.graphql
 
+    # Run several .graphql files concurrently (one shared session and JWT)
+    uv run python scripts/explore.py queries/get_me.graphql queries/get_flow_configs.graphql
+
     # Run an inline query
     uv run python scripts/explore.py -q '{ me { id } }'
 
@@ -24,13 +27,34 @@ from __future__ import annotations
 import argparse
 import asyncio
 import json
+import re
 import sys
 from pathlib import Path
 from typing import Any
 
 import aiohttp
 
-from deezer_python_gql.base_client import DeezerBaseClient
+from deezer_python_gql.base_client import DeezerBaseClient, GQLResponse
+
+try:
+    import orjson
+except ImportError:  # Optional speedup — fall back to stdlib json
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
+try:
+    import uvloop
+except ImportError:  # Optional speedup (not available on Windows) — use the default loop
+    HAS_UVLOOP = False
+else:
+    HAS_UVLOOP = True
+
+# Matches a DEEZER_ARL=... line, tolerating quotes and a trailing comment
+_ARL_RE = re.compile(
+    r"""^[ \t]*DEEZER_ARL[ \t]*=[ \t]*["']?([^"'\r\n#]+?)["']?[ \t]*(?:#.*)?\r?$""",
+    re.MULTILINE,
+)
 
 
 def load_arl() -> str:
@@ -41,32 +65,103 @@ def load_arl() -> str:
         print("  echo 'DEEZER_ARL=your_arl_here' > .env", file=sys.stderr)  # noqa: T201
         sys.exit(1)
 
-    for raw_line in env_file.read_text().splitlines():
-        stripped = raw_line.strip()
-        if stripped.startswith("#") or not stripped:
-            continue
-        if stripped.startswith("DEEZER_ARL="):
-            value = stripped.split("=", 1)[1].strip().strip("'\"")
-            if value and value != "your_arl_here":
-                return value
+    for match in _ARL_RE.finditer(env_file.read_text()):
+        value = match.group(1)
+        if value != "your_arl_here":
+            return value
 
     print("Error: DEEZER_ARL not set in .env file.", file=sys.stderr)  # noqa: T201
     sys.exit(1)
 
 
-async def run_query(arl: str, query: str, variables: dict[str, Any] | None = None) -> None:
-    """Execute a GraphQL query and print the JSON response."""
-    async with aiohttp.ClientSession() as session:
-        client = DeezerBaseClient(arl=arl, session=session)
-        response = await client.execute(query=query, variables=variables)
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
-    # Print raw JSON response (not just data — includes errors if any)
+def format_json(obj: Any) -> str:
+    """Pretty-print an object as indented JSON, using orjson when available."""
+    if HAS_ORJSON:
+        result: str = orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+        return result
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def print_response(response: GQLResponse) -> None:
+    """Print the raw JSON response (not just data — includes errors if any)."""
     try:
-        result = json.loads(response.data)
+        result = json_loads(response.data)
     except ValueError:
         result = {"raw": response.data.decode(errors="replace")}
 
-    print(json.dumps(result, indent=2, ensure_ascii=False))  # noqa: T201
+    print(format_json(result))  # noqa: T201
+
+
+async def run_query(
+    arl: str,
+    query: str,
+    variables: dict[str, Any] | None = None,
+    session: aiohttp.ClientSession | None = None,
+) -> bool:
+    """
+    Execute a GraphQL query and print the JSON response.
+
+    Shorthand for :func:`run_queries` with a single query.
+
+    :param arl: Deezer ARL cookie value for authentication.
+    :param query: The GraphQL query string.
+    :param variables: Optional query variables.
+    :param session: Optional aiohttp session to reuse across calls. If omitted,
+        a session is created for this query and closed afterwards.
+    :return: Whether the query completed without raising.
+    """
+    return await run_queries(arl, [("<query>", query)], variables, session)
+
+
+async def run_queries(
+    arl: str,
+    queries: list[tuple[str, str]],
+    variables: dict[str, Any] | None = None,
+    session: aiohttp.ClientSession | None = None,
+) -> bool:
+    """
+    Execute GraphQL queries concurrently and print each JSON response.
+
+    All queries go through one client, so the JWT is acquired only once and
+    the requests share a connection pool. Responses are printed in input order,
+    each under a ``# <label>`` header when there is more than one query; a
+    failing query prints its error without hiding the others.
+
+    :param arl: Deezer ARL cookie value for authentication.
+    :param queries: ``(label, query)`` pairs, e.g. a file path and its GraphQL query string.
+    :param variables: Optional query variables, passed to every query.
+    :param session: Optional aiohttp session to reuse across calls. If omitted,
+        a session is created for these queries and closed afterwards.
+    :return: Whether every query completed without raising.
+    """
+    if session is None:
+        async with aiohttp.ClientSession() as own_session:
+            return await run_queries(arl, queries, variables, session=own_session)
+
+    client = DeezerBaseClient(arl=arl, session=session)
+    responses = await asyncio.gather(
+        *(client.execute(query=query, variables=variables) for _, query in queries),
+        return_exceptions=True,
+    )
+    ok = True
+    for (label, _), response in zip(queries, responses, strict=True):
+        if len(queries) > 1:
+            print(f"# {label}")  # noqa: T201
+        if isinstance(response, BaseException):
+            print(f"Error: {response!r}")  # noqa: T201
+            ok = False
+        else:
+            print_response(response)
+    return ok
 
 
 def main() -> None:
@@ -76,15 +171,17 @@ def main() -> None:
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="Examples:\n"
         "  uv run python scripts/explore.py queries/get_me.graphql\n"
+        "  uv run python scripts/explore.py queries/get_me.graphql queries/get_flow.graphql\n"
         "  uv run python scripts/explore.py -q '{ me { id } }'\n"
         "  uv run python scripts/explore.py -q "
         "'query($id: String!) { track(trackId: $id) { title } }' "
         '-v \'{"id": "3135556"}\'',
     )
     parser.add_argument(
-        "file",
-        nargs="?",
-        help="Path to a .graphql file to execute",
+        "files",
+        nargs="*",
+        metavar="file",
+        help="Path to a .graphql file to execute (several files run concurrently)",
     )
     parser.add_argument(
         "-q",
@@ -98,14 +195,16 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    if args.file:
-        path = Path(args.file)
-        if not path.exists():
-            print(f"Error: file not found: {path}", file=sys.stderr)  # noqa: T201
-            sys.exit(1)
-        query = path.read_text()
+    queries: list[tuple[str, str]] = []
+    if args.files:
+        for file in args.files:
+            path = Path(file)
+            if not path.exists():
+                print(f"Error: file not found: {path}", file=sys.stderr)  # noqa: T201
+                sys.exit(1)
+            queries.append((file, path.read_text()))
     elif args.query:
-        query = args.query
+        queries.append(("<inline>", args.query))
     else:
         parser.print_help()
         sys.exit(1)
@@ -115,7 +214,9 @@ def main() -> None:
         variables = json.loads(args.variables)
 
     arl = load_arl()
-    asyncio.run(run_query(arl, query, variables))
+    coro = run_queries(arl, queries, variables)
+    if not asyncio.run(coro, loop_factory=uvloop.new_event_loop if HAS_UVLOOP else None):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
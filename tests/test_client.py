@@ -13,11 +13,14 @@ import asyncio
 import base64
 import json
 import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from pydantic import BaseModel
 
 from deezer_python_gql import DeezerGQLClient
 from deezer_python_gql.base_client import (
@@ -114,14 +117,38 @@ from deezer_python_gql.generated.search_flows import SearchFlows
 from deezer_python_gql.generated.unbookmark_podcast_episode import UnbookmarkPodcastEpisode
 from deezer_python_gql.generated.update_playlist import UpdatePlaylist
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+    from aiohttp import ClientSession
+
 FIXTURES = Path(__file__).parent / "fixtures"
 
 
-def _load_fixture(name: str) -> dict[str, Any]:
-    """Load a JSON fixture file and return its data dict."""
-    with (FIXTURES / name).open() as f:
-        result: dict[str, Any] = json.load(f)["data"]
-    return result
+class _FixtureEnvelope[ModelT: BaseModel](BaseModel):
+    """The ``{"data": ...}`` envelope every fixture file is wrapped in."""
+
+    data: ModelT
+
+
+def _validate_fixture[ModelT: BaseModel](model: type[ModelT], name: str) -> ModelT:
+    """
+    Validate a fixture file's data payload into ``model``.
+
+    The raw file bytes go straight to ``model_validate_json``, so pydantic parses
+    and validates in one pass without building an intermediate Python dict.
+    """
+    raw = (FIXTURES / name).read_bytes()
+    return _FixtureEnvelope[model].model_validate_json(raw).data  # type: ignore[valid-type]
+
+
+def _b64(raw: bytes) -> str:
+    """Encode bytes as unpadded base64url, as used for JWT segments."""
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+# JWT header segment shared by every fake token
+_JWT_HEADER = _b64(b'{"alg":"ES256"}')
 
 
 def _make_jwt(exp: float | None = None) -> str:
@@ -132,15 +159,12 @@ def _make_jwt(exp: float | None = None) -> str:
     """
     if exp is None:
         exp = time.time() + 360  # 6 min, matching Deezer's real TTL
-    header = base64.urlsafe_b64encode(b'{"alg":"ES256"}').rstrip(b"=").decode()
-    payload = (
-        base64.urlsafe_b64encode(
-            json.dumps({"exp": exp}).encode(),
-        )
-        .rstrip(b"=")
-        .decode()
-    )
-    return f"{header}.{payload}.fake_signature"
+    payload = _b64(f'{{"exp":{exp}}}'.encode())
+    return f"{_JWT_HEADER}.{payload}.fake_signature"
+
+
+# Far-future JWT for tests that only need "some valid token" (expiry is seeded separately)
+_FIXED_JWT_LONG = _make_jwt(exp=9999999999.0)
 
 
 def _mock_post_context_manager(response_body: bytes, status: int = 200) -> AsyncMock:
@@ -171,6 +195,67 @@ def _mock_auth_cm(jwt: str | None = None) -> AsyncMock:
     return _mock_post_context_manager(body)
 
 
+@dataclass(frozen=True, slots=True)
+class _FakeResponse:
+    """Canned aiohttp-style response served by _FakeSession."""
+
+    status: int
+    body: bytes
+
+    @property
+    def ok(self) -> bool:
+        """Mirror aiohttp's ClientResponse.ok for the statuses used in tests."""
+        return 200 <= self.status < 300
+
+    async def read(self) -> bytes:
+        """Return the raw response body."""
+        return self.body
+
+    async def text(self) -> str:
+        """Return the response body decoded as text."""
+        return self.body.decode()
+
+
+@dataclass
+class _FakeSession:
+    """
+    Minimal stand-in for aiohttp.ClientSession, injected via ``session=``.
+
+    Every ``post()`` is recorded in ``calls`` and answered by ``handler``,
+    a plain function of the URL and request kwargs.
+    """
+
+    handler: Callable[[str, dict[str, Any]], _FakeResponse]
+    calls: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
+
+    @asynccontextmanager
+    async def post(self, url: str, **kwargs: Any) -> AsyncIterator[_FakeResponse]:
+        """Record the request and yield the handler's response."""
+        self.calls.append((url, kwargs))
+        yield self.handler(url, kwargs)
+
+    def as_session(self) -> ClientSession:
+        """Return this fake typed as a ClientSession for DeezerBaseClient."""
+        return cast("ClientSession", self)
+
+
+def _deezer_session(jwt: str | None = None) -> _FakeSession:
+    """
+    Create a fake session serving a JWT from auth.deezer.com and ``me`` from Pipe.
+
+    :param jwt: JWT returned by the auth endpoint. Defaults to a fresh 6-min token.
+    """
+    auth_body = json.dumps({"jwt": jwt or _make_jwt()}).encode()
+    gql_body = json.dumps({"data": {"me": {"id": "1"}}}).encode()
+
+    def handler(url: str, _kwargs: dict[str, Any]) -> _FakeResponse:
+        if url == DeezerBaseClient.AUTH_URL:
+            return _FakeResponse(200, auth_body)
+        return _FakeResponse(200, gql_body)
+
+    return _FakeSession(handler)
+
+
 # ---------------------------------------------------------------------------
 # 1. Client setup
 # ---------------------------------------------------------------------------
@@ -321,70 +406,42 @@ async def test_context_manager_calls_close() -> None:
 async def test_auth_acquires_jwt_on_first_request() -> None:
     """Verify the client fetches a JWT via ARL on the first execute() call."""
     jwt = _make_jwt()
-    client = DeezerBaseClient(arl="test_arl")
+    session = _deezer_session(jwt)
+    client = DeezerBaseClient(arl="test_arl", session=session.as_session())
 
-    auth_cm = _mock_auth_cm(jwt)
-    gql_cm = _mock_post_context_manager(
-        json.dumps({"data": {"me": {"id": "1"}}}).encode(),
-    )
-
-    with patch("deezer_python_gql.base_client.ClientSession") as mock_cls:
-        mock_instance = MagicMock()
-        mock_instance.post = MagicMock(side_effect=[auth_cm, gql_cm])
-        mock_instance.close = AsyncMock()
-        mock_cls.return_value = mock_instance
-
-        resp = await client.execute(query="{ me { id } }")
+    resp = await client.execute(query="{ me { id } }")
 
     assert resp.status == 200
     assert client._jwt == jwt  # noqa: SLF001
+    assert [url for url, _ in session.calls] == [client.AUTH_URL, client.url]
 
 
 @pytest.mark.asyncio
 async def test_auth_reuses_valid_jwt() -> None:
     """Verify the client does NOT re-auth when the JWT is still valid."""
-    client = DeezerBaseClient(arl="test_arl")
+    session = _deezer_session()
+    client = DeezerBaseClient(arl="test_arl", session=session.as_session())
     # Pre-seed a valid JWT (expires far in the future)
-    client._jwt = _make_jwt(exp=time.time() + 600)  # noqa: SLF001
+    client._jwt = _FIXED_JWT_LONG  # noqa: SLF001
     client._jwt_expires_at = time.time() + 600  # noqa: SLF001
 
-    gql_cm = _mock_post_context_manager(
-        json.dumps({"data": {"me": {"id": "1"}}}).encode(),
-    )
-
-    with patch("deezer_python_gql.base_client.ClientSession") as mock_cls:
-        mock_instance = MagicMock()
-        mock_instance.post = MagicMock(return_value=gql_cm)
-        mock_instance.close = AsyncMock()
-        mock_cls.return_value = mock_instance
-
-        await client.execute(query="{ me { id } }")
+    await client.execute(query="{ me { id } }")
 
-        # Only 1 call (the GQL query), no auth call
-        assert mock_instance.post.call_count == 1
+    # Only 1 call (the GQL query), no auth call
+    assert len(session.calls) == 1
 
 
 @pytest.mark.asyncio
 async def test_auth_refreshes_expiring_jwt() -> None:
     """Verify the client refreshes when JWT is within the 30s margin."""
-    client = DeezerBaseClient(arl="test_arl")
+    new_jwt = _make_jwt(exp=time.time() + 600)
+    session = _deezer_session(new_jwt)
+    client = DeezerBaseClient(arl="test_arl", session=session.as_session())
     # Pre-seed a JWT that expires in 10 seconds (within 30s margin)
     client._jwt = _make_jwt(exp=time.time() + 10)  # noqa: SLF001
     client._jwt_expires_at = time.time() + 10  # noqa: SLF001
 
-    new_jwt = _make_jwt(exp=time.time() + 600)
-    auth_cm = _mock_auth_cm(new_jwt)
-    gql_cm = _mock_post_context_manager(
-        json.dumps({"data": {"me": {"id": "1"}}}).encode(),
-    )
-
-    with patch("deezer_python_gql.base_client.ClientSession") as mock_cls:
-        mock_instance = MagicMock()
-        mock_instance.post = MagicMock(side_effect=[auth_cm, gql_cm])
-        mock_instance.close = AsyncMock()
-        mock_cls.return_value = mock_instance
-
-        await client.execute(query="{ me { id } }")
+    await client.execute(query="{ me { id } }")
 
     assert client._jwt == new_jwt  # noqa: SLF001
 
@@ -392,42 +449,24 @@ async def test_auth_refreshes_expiring_jwt() -> None:
 @pytest.mark.asyncio
 async def test_auth_sends_arl_cookie_to_correct_domain() -> None:
     """Verify the ARL cookie is sent to auth.deezer.com, not www.deezer.com."""
-    client = DeezerBaseClient(arl="my_secret_arl")
-
-    auth_cm = _mock_auth_cm()
-    gql_cm = _mock_post_context_manager(
-        json.dumps({"data": {"me": {"id": "1"}}}).encode(),
-    )
-
-    with patch("deezer_python_gql.base_client.ClientSession") as mock_cls:
-        mock_instance = MagicMock()
-        mock_instance.post = MagicMock(side_effect=[auth_cm, gql_cm])
-        mock_instance.close = AsyncMock()
-        mock_cls.return_value = mock_instance
+    session = _deezer_session()
+    client = DeezerBaseClient(arl="my_secret_arl", session=session.as_session())
 
-        await client.execute(query="{ me { id } }")
+    await client.execute(query="{ me { id } }")
 
     # First call was the auth request
-    auth_call = mock_instance.post.call_args_list[0]
-    assert auth_call.args[0] == "https://auth.deezer.com/login/arl"
-    assert auth_call.kwargs["cookies"] == {"arl": "my_secret_arl"}
+    auth_url, auth_kwargs = session.calls[0]
+    assert auth_url == "https://auth.deezer.com/login/arl"
+    assert auth_kwargs["cookies"] == {"arl": "my_secret_arl"}
 
 
 @pytest.mark.asyncio
 async def test_auth_parses_text_plain_response() -> None:
     """Verify the client handles auth.deezer.com's text/plain JSON response."""
     jwt = _make_jwt()
-    client = DeezerBaseClient(arl="test")
+    client = DeezerBaseClient(arl="test", session=_deezer_session(jwt).as_session())
 
-    auth_cm = _mock_auth_cm(jwt)
-
-    with patch("deezer_python_gql.base_client.ClientSession") as mock_cls:
-        mock_instance = MagicMock()
-        mock_instance.post = MagicMock(return_value=auth_cm)
-        mock_instance.close = AsyncMock()
-        mock_cls.return_value = mock_instance
-
-        result = await client._ensure_jwt()  # noqa: SLF001
+    result = await client._ensure_jwt()  # noqa: SLF001
 
     assert result == jwt
     assert client._jwt_expires_at > 0  # noqa: SLF001
@@ -524,7 +563,7 @@ async def test_auth_concurrent_refresh_single_auth_call() -> None:
 async def test_execute_sets_default_timeout() -> None:
     """Verify execute() applies the 30s default request timeout."""
     client = DeezerBaseClient(arl="test_arl")
-    client._jwt = _make_jwt(exp=time.time() + 600)  # noqa: SLF001
+    client._jwt = _FIXED_JWT_LONG  # noqa: SLF001
     client._jwt_expires_at = time.time() + 600  # noqa: SLF001
 
     gql_cm = _mock_post_context_manager(json.dumps({"data": {"me": {"id": "1"}}}).encode())
@@ -632,7 +671,7 @@ def test_get_data_returns_data_on_success() -> None:
 async def test_check_audiobook_ids_returns_matching() -> None:
     """Verify check_audiobook_ids returns IDs that are valid audiobooks."""
     client = DeezerBaseClient(arl="test_arl")
-    client._jwt = _make_jwt(exp=time.time() + 600)  # noqa: SLF001
+    client._jwt = _FIXED_JWT_LONG  # noqa: SLF001
     client._jwt_expires_at = time.time() + 600  # noqa: SLF001
 
     # a0 is an audiobook (has displayTitle), a1 is not (displayTitle is null)
@@ -670,7 +709,7 @@ async def test_check_audiobook_ids_empty_input() -> None:
 async def test_check_audiobook_ids_chunks_large_input() -> None:
     """Verify large ID lists are split into multiple aliased queries."""
     client = DeezerBaseClient(arl="test_arl")
-    client._jwt = _make_jwt(exp=time.time() + 600)  # noqa: SLF001
+    client._jwt = _FIXED_JWT_LONG  # noqa: SLF001
     client._jwt_expires_at = time.time() + 600  # noqa: SLF001
 
     chunk_size = DeezerBaseClient.AUDIOBOOK_CHECK_CHUNK_SIZE
@@ -702,7 +741,7 @@ async def test_check_audiobook_ids_chunks_large_input() -> None:
 async def test_check_audiobook_ids_escapes_ids() -> None:
     """Verify IDs are JSON-escaped and cannot break out of the query string."""
     client = DeezerBaseClient(arl="test_arl")
-    client._jwt = _make_jwt(exp=time.time() + 600)  # noqa: SLF001
+    client._jwt = _FIXED_JWT_LONG  # noqa: SLF001
     client._jwt_expires_at = time.time() + 600  # noqa: SLF001
 
     gql_cm = _mock_post_context_manager(json.dumps({"data": {"a0": None}}).encode())
@@ -723,7 +762,7 @@ async def test_check_audiobook_ids_escapes_ids() -> None:
 async def test_check_audiobook_ids_swallows_alias_scoped_errors() -> None:
     """Verify per-alias not-found errors yield an empty set (none are audiobooks)."""
     client = DeezerBaseClient(arl="test_arl")
-    client._jwt = _make_jwt(exp=time.time() + 600)  # noqa: SLF001
+    client._jwt = _FIXED_JWT_LONG  # noqa: SLF001
     client._jwt_expires_at = time.time() + 600  # noqa: SLF001
 
     gql_cm = _mock_post_context_manager(
@@ -753,7 +792,7 @@ async def test_check_audiobook_ids_swallows_alias_scoped_errors() -> None:
 async def test_check_audiobook_ids_raises_on_query_level_errors() -> None:
     """Verify non-alias errors (e.g. complexity limit) surface instead of being swallowed."""
     client = DeezerBaseClient(arl="test_arl")
-    client._jwt = _make_jwt(exp=time.time() + 600)  # noqa: SLF001
+    client._jwt = _FIXED_JWT_LONG  # noqa: SLF001
     client._jwt_expires_at = time.time() + 600  # noqa: SLF001
 
     gql_cm = _mock_post_context_manager(
@@ -797,16 +836,14 @@ def test_get_data_error_uses_response_operation_name() -> None:
 
 def test_smoke_get_me() -> None:
     """Verify GetMe fixture parses and the user ID is accessible."""
-    data = _load_fixture("get_me.json")
-    result = GetMe.model_validate(data)
+    result = _validate_fixture(GetMe, "get_me.json")
     assert result.me is not None
     assert result.me.id == "1234567890"
 
 
 def test_smoke_get_track() -> None:
     """Verify GetTrack fixture parses with nested album, contributors, and media."""
-    data = _load_fixture("get_track.json")
-    track = GetTrack.model_validate(data).track
+    track = _validate_fixture(GetTrack, "get_track.json").track
     assert track is not None
     assert track.id == "3135556"
     assert track.title == "Harder, Better, Faster, Stronger"
@@ -821,8 +858,7 @@ def test_smoke_get_track() -> None:
 
 def test_smoke_get_album() -> None:
     """Verify GetAlbum fixture parses with cover, contributors, and paginated tracks."""
-    data = _load_fixture("get_album.json")
-    album = GetAlbum.model_validate(data).album
+    album = _validate_fixture(GetAlbum, "get_album.json").album
     assert album is not None
     assert album.id == "302127"
     assert album.display_title == "Discovery"
@@ -833,8 +869,7 @@ def test_smoke_get_album() -> None:
 
 def test_smoke_get_artist() -> None:
     """Verify GetArtist fixture parses with picture, top tracks, and albums."""
-    data = _load_fixture("get_artist.json")
-    artist = GetArtist.model_validate(data).artist
+    artist = _validate_fixture(GetArtist, "get_artist.json").artist
     assert artist is not None
     assert artist.id == "27"
     assert artist.name == "Daft Punk"
@@ -846,8 +881,7 @@ def test_smoke_get_artist() -> None:
 
 def test_smoke_get_playlist() -> None:
     """Verify GetPlaylist fixture parses with owner and paginated tracks."""
-    data = _load_fixture("get_playlist.json")
-    playlist = GetPlaylist.model_validate(data).playlist
+    playlist = _validate_fixture(GetPlaylist, "get_playlist.json").playlist
     assert playlist is not None
     assert playlist.id == "53362031"
     assert playlist.title
@@ -857,8 +891,7 @@ def test_smoke_get_playlist() -> None:
 
 def test_smoke_search() -> None:
     """Verify Search fixture parses all result types with pagination info."""
-    data = _load_fixture("search.json")
-    search = Search.model_validate(data).search
+    search = _validate_fixture(Search, "search.json").search
     assert search is not None
     results = search.results
     assert len(results.tracks.edges) > 0
@@ -878,8 +911,7 @@ def test_smoke_search() -> None:
 
 def test_smoke_get_flow() -> None:
     """Verify GetFlow fixture parses with flow tracks."""
-    data = _load_fixture("get_flow.json")
-    me = GetFlow.model_validate(data).me
+    me = _validate_fixture(GetFlow, "get_flow.json").me
     assert me is not None
     assert me.flow is not None
     assert me.flow.id == "flow:default"
@@ -891,8 +923,7 @@ def test_smoke_get_flow() -> None:
 
 def test_smoke_get_flow_batch() -> None:
     """Verify GetFlowBatch fixture parses 4 aliased track batches."""
-    data = _load_fixture("get_flow_batch.json")
-    me = GetFlowBatch.model_validate(data).me
+    me = _validate_fixture(GetFlowBatch, "get_flow_batch.json").me
     assert me is not None
     flow = me.flow
     assert flow is not None
@@ -913,8 +944,7 @@ def test_smoke_get_flow_batch() -> None:
 
 def test_smoke_get_flow_configs() -> None:
     """Verify GetFlowConfigs fixture parses mood and genre flow configs."""
-    data = _load_fixture("get_flow_configs.json")
-    me = GetFlowConfigs.model_validate(data).me
+    me = _validate_fixture(GetFlowConfigs, "get_flow_configs.json").me
     assert me is not None
     configs = me.flow_configs
     assert len(configs.moods.edges) == 3
@@ -930,8 +960,7 @@ def test_smoke_get_flow_configs() -> None:
 
 def test_smoke_get_flow_config_tracks() -> None:
     """Verify GetFlowConfigTracks fixture parses tracks for a flow config."""
-    data = _load_fixture("get_flow_config_tracks.json")
-    flow_config = GetFlowConfigTracks.model_validate(data).flow_config
+    flow_config = _validate_fixture(GetFlowConfigTracks, "get_flow_config_tracks.json").flow_config
     assert flow_config is not None
     assert flow_config.id == "flow_config:chill"
     assert flow_config.title == "Chill"
@@ -942,8 +971,7 @@ def test_smoke_get_flow_config_tracks() -> None:
 
 def test_smoke_get_made_for_me() -> None:
     """Verify GetMadeForMe fixture parses SmartTracklist and Flow items."""
-    data = _load_fixture("get_made_for_me.json")
-    me = GetMadeForMe.model_validate(data).me
+    me = _validate_fixture(GetMadeForMe, "get_made_for_me.json").me
     assert me is not None
     edges = me.made_for_me.edges
     assert len(edges) == 3
@@ -958,8 +986,7 @@ def test_smoke_get_made_for_me() -> None:
 
 def test_smoke_get_smart_tracklist() -> None:
     """Verify GetSmartTracklist fixture parses with paginated tracks."""
-    data = _load_fixture("get_smart_tracklist.json")
-    st = GetSmartTracklist.model_validate(data).smart_tracklist
+    st = _validate_fixture(GetSmartTracklist, "get_smart_tracklist.json").smart_tracklist
     assert st is not None
     assert st.id == "smart:daily_mix_1"
     assert st.title == "Your Daily Mix 1"
@@ -972,8 +999,7 @@ def test_smoke_get_smart_tracklist() -> None:
 
 def test_smoke_get_charts() -> None:
     """Verify GetCharts fixture parses all chart categories."""
-    data = _load_fixture("get_charts.json")
-    charts = GetCharts.model_validate(data).charts
+    charts = _validate_fixture(GetCharts, "get_charts.json").charts
     assert charts is not None
     country = charts.country
     assert country is not None
@@ -992,8 +1018,7 @@ def test_smoke_get_charts() -> None:
 
 def test_smoke_get_recommendations() -> None:
     """Verify GetRecommendations fixture parses all recommendation categories."""
-    data = _load_fixture("get_recommendations.json")
-    me = GetRecommendations.model_validate(data).me
+    me = _validate_fixture(GetRecommendations, "get_recommendations.json").me
     assert me is not None
     reco = me.recommendations
     assert len(reco.playlists.edges) > 0
@@ -1009,8 +1034,7 @@ def test_smoke_get_recommendations() -> None:
 
 def test_smoke_get_recently_played() -> None:
     """Verify GetRecentlyPlayed fixture parses mixed content types."""
-    data = _load_fixture("get_recently_played.json")
-    me = GetRecentlyPlayed.model_validate(data).me
+    me = _validate_fixture(GetRecentlyPlayed, "get_recently_played.json").me
     assert me is not None
     edges = me.recently_played.edges
     assert len(edges) == 5
@@ -1034,8 +1058,7 @@ def test_smoke_get_recently_played() -> None:
 
 def test_smoke_get_favorite_artists() -> None:
     """Verify GetFavoriteArtists fixture parses with pagination."""
-    data = _load_fixture("get_favorite_artists.json")
-    me = GetFavoriteArtists.model_validate(data).me
+    me = _validate_fixture(GetFavoriteArtists, "get_favorite_artists.json").me
     assert me is not None
     artists = me.user_favorites.artists
     assert artists is not None
@@ -1049,8 +1072,7 @@ def test_smoke_get_favorite_artists() -> None:
 
 def test_smoke_get_favorite_albums() -> None:
     """Verify GetFavoriteAlbums fixture parses with pagination."""
-    data = _load_fixture("get_favorite_albums.json")
-    me = GetFavoriteAlbums.model_validate(data).me
+    me = _validate_fixture(GetFavoriteAlbums, "get_favorite_albums.json").me
     assert me is not None
     albums = me.user_favorites.albums
     assert albums is not None
@@ -1064,8 +1086,7 @@ def test_smoke_get_favorite_albums() -> None:
 
 def test_smoke_get_favorite_tracks() -> None:
     """Verify GetFavoriteTracks fixture parses with pagination."""
-    data = _load_fixture("get_favorite_tracks.json")
-    me = GetFavoriteTracks.model_validate(data).me
+    me = _validate_fixture(GetFavoriteTracks, "get_favorite_tracks.json").me
     assert me is not None
     tracks = me.user_favorites.tracks
     assert tracks is not None
@@ -1079,8 +1100,7 @@ def test_smoke_get_favorite_tracks() -> None:
 
 def test_smoke_get_favorite_playlists() -> None:
     """Verify GetFavoritePlaylists fixture parses with pagination."""
-    data = _load_fixture("get_favorite_playlists.json")
-    me = GetFavoritePlaylists.model_validate(data).me
+    me = _validate_fixture(GetFavoritePlaylists, "get_favorite_playlists.json").me
     assert me is not None
     playlists = me.user_favorites.playlists
     assert playlists is not None
@@ -1094,8 +1114,7 @@ def test_smoke_get_favorite_playlists() -> None:
 
 def test_smoke_search_flows() -> None:
     """Verify SearchFlows fixture parses with flow config nodes."""
-    data = _load_fixture("search_flows.json")
-    search = SearchFlows.model_validate(data).search
+    search = _validate_fixture(SearchFlows, "search_flows.json").search
     assert search is not None
     flow_configs = search.results.flow_configs
     assert len(flow_configs.edges) == 5
@@ -1110,8 +1129,7 @@ def test_smoke_search_flows() -> None:
 
 def test_smoke_get_user_charts() -> None:
     """Verify GetUserCharts fixture parses personal top tracks, artists, and albums."""
-    data = _load_fixture("get_user_charts.json")
-    me = GetUserCharts.model_validate(data).me
+    me = _validate_fixture(GetUserCharts, "get_user_charts.json").me
     assert me is not None
     charts = me.charts
     assert charts is not None
@@ -1130,8 +1148,7 @@ def test_smoke_get_user_charts() -> None:
 
 def test_smoke_get_user_playlists() -> None:
     """Verify GetUserPlaylists fixture parses with paginated playlist nodes."""
-    data = _load_fixture("get_user_playlists.json")
-    me = GetUserPlaylists.model_validate(data).me
+    me = _validate_fixture(GetUserPlaylists, "get_user_playlists.json").me
     assert me is not None
     playlists = me.playlists
     assert len(playlists.edges) == 1
@@ -1152,8 +1169,7 @@ def test_smoke_get_user_playlists() -> None:
 
 def test_smoke_get_personal_tracks() -> None:
     """Verify GetPersonalTracks fixture parses with paginated track nodes."""
-    data = _load_fixture("get_personal_tracks.json")
-    me = GetPersonalTracks.model_validate(data).me
+    me = _validate_fixture(GetPersonalTracks, "get_personal_tracks.json").me
     assert me is not None
     tracks = me.personal_tracks
     assert len(tracks.edges) == 2
@@ -1172,64 +1188,56 @@ def test_smoke_get_personal_tracks() -> None:
 
 def test_smoke_add_artist_to_favorite() -> None:
     """Verify AddArtistToFavorite fixture parses with returned artist."""
-    data = _load_fixture("add_artist_to_favorite.json")
-    result = AddArtistToFavorite.model_validate(data)
+    result = _validate_fixture(AddArtistToFavorite, "add_artist_to_favorite.json")
     assert result.add_artist_to_favorite.artist.id == "100000001"
     assert result.add_artist_to_favorite.artist.name == "Test Artist"
 
 
 def test_smoke_remove_artist_from_favorite() -> None:
     """Verify RemoveArtistFromFavorite fixture parses with returned artist."""
-    data = _load_fixture("remove_artist_from_favorite.json")
-    result = RemoveArtistFromFavorite.model_validate(data)
+    result = _validate_fixture(RemoveArtistFromFavorite, "remove_artist_from_favorite.json")
     assert result.remove_artist_from_favorite.artist.id == "100000001"
     assert result.remove_artist_from_favorite.artist.name == "Test Artist"
 
 
 def test_smoke_add_album_to_favorite() -> None:
     """Verify AddAlbumToFavorite fixture parses with returned album."""
-    data = _load_fixture("add_album_to_favorite.json")
-    result = AddAlbumToFavorite.model_validate(data)
+    result = _validate_fixture(AddAlbumToFavorite, "add_album_to_favorite.json")
     assert result.add_album_to_favorite.album.id == "100000001"
     assert result.add_album_to_favorite.album.display_title == "Test Album"
 
 
 def test_smoke_remove_album_from_favorite() -> None:
     """Verify RemoveAlbumFromFavorite fixture parses with returned album."""
-    data = _load_fixture("remove_album_from_favorite.json")
-    result = RemoveAlbumFromFavorite.model_validate(data)
+    result = _validate_fixture(RemoveAlbumFromFavorite, "remove_album_from_favorite.json")
     assert result.remove_album_from_favorite.album.id == "100000001"
     assert result.remove_album_from_favorite.album.display_title == "Test Album"
 
 
 def test_smoke_add_track_to_favorite() -> None:
     """Verify AddTrackToFavorite fixture parses with returned track."""
-    data = _load_fixture("add_track_to_favorite.json")
-    result = AddTrackToFavorite.model_validate(data)
+    result = _validate_fixture(AddTrackToFavorite, "add_track_to_favorite.json")
     assert result.add_track_to_favorite.track.id == "100000001"
     assert result.add_track_to_favorite.track.title == "Test Track"
 
 
 def test_smoke_remove_track_from_favorite() -> None:
     """Verify RemoveTrackFromFavorite fixture parses with returned track."""
-    data = _load_fixture("remove_track_from_favorite.json")
-    result = RemoveTrackFromFavorite.model_validate(data)
+    result = _validate_fixture(RemoveTrackFromFavorite, "remove_track_from_favorite.json")
     assert result.remove_track_from_favorite.track.id == "100000001"
     assert result.remove_track_from_favorite.track.title == "Test Track"
 
 
 def test_smoke_add_playlist_to_favorite() -> None:
     """Verify AddPlaylistToFavorite fixture parses with returned playlist."""
-    data = _load_fixture("add_playlist_to_favorite.json")
-    result = AddPlaylistToFavorite.model_validate(data)
+    result = _validate_fixture(AddPlaylistToFavorite, "add_playlist_to_favorite.json")
     assert result.add_playlist_to_favorite.playlist.id == "1000000001"
     assert result.add_playlist_to_favorite.playlist.title == "Test Playlist"
 
 
 def test_smoke_remove_playlist_from_favorite() -> None:
     """Verify RemovePlaylistFromFavorite fixture parses with returned playlist."""
-    data = _load_fixture("remove_playlist_from_favorite.json")
-    result = RemovePlaylistFromFavorite.model_validate(data)
+    result = _validate_fixture(RemovePlaylistFromFavorite, "remove_playlist_from_favorite.json")
     assert result.remove_playlist_from_favorite.playlist.id == "1000000001"
     assert result.remove_playlist_from_favorite.playlist.title == "Test Playlist"
 
@@ -1241,8 +1249,7 @@ def test_smoke_remove_playlist_from_favorite() -> None:
 
 def test_smoke_create_playlist() -> None:
     """Verify CreatePlaylist fixture parses with returned playlist."""
-    data = _load_fixture("create_playlist.json")
-    result = CreatePlaylist.model_validate(data)
+    result = _validate_fixture(CreatePlaylist, "create_playlist.json")
     playlist = result.create_playlist.playlist
     assert playlist is not None
     assert playlist.id == "1000000001"
@@ -1251,8 +1258,7 @@ def test_smoke_create_playlist() -> None:
 
 def test_smoke_update_playlist() -> None:
     """Verify UpdatePlaylist fixture parses with returned playlist."""
-    data = _load_fixture("update_playlist.json")
-    result = UpdatePlaylist.model_validate(data)
+    result = _validate_fixture(UpdatePlaylist, "update_playlist.json")
     playlist = result.update_playlist.playlist
     assert playlist is not None
     assert playlist.id == "1000000001"
@@ -1261,15 +1267,13 @@ def test_smoke_update_playlist() -> None:
 
 def test_smoke_delete_playlist() -> None:
     """Verify DeletePlaylist fixture parses with delete status."""
-    data = _load_fixture("delete_playlist.json")
-    result = DeletePlaylist.model_validate(data)
+    result = _validate_fixture(DeletePlaylist, "delete_playlist.json")
     assert result.delete_playlist.delete_status is True
 
 
 def test_smoke_add_tracks_to_playlist() -> None:
     """Verify AddTracksToPlaylist fixture parses the union success variant."""
-    data = _load_fixture("add_tracks_to_playlist.json")
-    result = AddTracksToPlaylist.model_validate(data)
+    result = _validate_fixture(AddTracksToPlaylist, "add_tracks_to_playlist.json")
     output = result.add_tracks_to_playlist
     assert output.typename__ == "PlaylistAddTracksOutput"
     assert output.added_track_ids == ["100000001", "100000002"]
@@ -1277,15 +1281,13 @@ def test_smoke_add_tracks_to_playlist() -> None:
 
 def test_smoke_remove_tracks_from_playlist() -> None:
     """Verify RemoveTracksFromPlaylist fixture parses with removed track IDs."""
-    data = _load_fixture("remove_tracks_from_playlist.json")
-    result = RemoveTracksFromPlaylist.model_validate(data)
+    result = _validate_fixture(RemoveTracksFromPlaylist, "remove_tracks_from_playlist.json")
     assert result.remove_tracks_from_playlist.removed_track_ids == ["100000001", "100000002"]
 
 
 def test_smoke_get_livestream() -> None:
     """Verify GetLivestream fixture parses with fields and media URLs."""
-    data = _load_fixture("get_livestream.json")
-    result = GetLivestream.model_validate(data)
+    result = _validate_fixture(GetLivestream, "get_livestream.json")
     ls = result.livestream
     assert ls is not None
     assert ls.id == "12345"
@@ -1307,8 +1309,7 @@ def test_smoke_get_livestream() -> None:
 
 def test_smoke_get_podcast() -> None:
     """Verify GetPodcast fixture parses with episodes and rights."""
-    data = _load_fixture("get_podcast.json")
-    podcast = GetPodcast.model_validate(data).podcast
+    podcast = _validate_fixture(GetPodcast, "get_podcast.json").podcast
     assert podcast is not None
     assert podcast.id == "1234"
     assert podcast.display_title == "Tech Weekly"
@@ -1330,8 +1331,7 @@ def test_smoke_get_podcast() -> None:
 
 def test_smoke_get_podcast_episode() -> None:
     """Verify GetPodcastEpisode fixture parses with podcast and URL."""
-    data = _load_fixture("get_podcast_episode.json")
-    ep = GetPodcastEpisode.model_validate(data).podcast_episode
+    ep = _validate_fixture(GetPodcastEpisode, "get_podcast_episode.json").podcast_episode
     assert ep is not None
     assert ep.id == "ep_100"
     assert ep.title == "Episode 100: AI Revolution"
@@ -1344,8 +1344,9 @@ def test_smoke_get_podcast_episode() -> None:
 
 def test_smoke_get_podcast_episodes_by_ids() -> None:
     """Verify GetPodcastEpisodesByIds fixture parses with nullable entries."""
-    data = _load_fixture("get_podcast_episodes_by_ids.json")
-    episodes = GetPodcastEpisodesByIds.model_validate(data).podcast_episodes_by_ids
+    episodes = _validate_fixture(
+        GetPodcastEpisodesByIds, "get_podcast_episodes_by_ids.json"
+    ).podcast_episodes_by_ids
     assert len(episodes) == 3
     assert episodes[0] is not None
     assert episodes[0].id == "ep_100"
@@ -1358,8 +1359,7 @@ def test_smoke_get_podcast_episodes_by_ids() -> None:
 
 def test_smoke_get_favorite_podcasts() -> None:
     """Verify GetFavoritePodcasts fixture parses with pagination."""
-    data = _load_fixture("get_favorite_podcasts.json")
-    me = GetFavoritePodcasts.model_validate(data).me
+    me = _validate_fixture(GetFavoritePodcasts, "get_favorite_podcasts.json").me
     assert me is not None
     podcasts = me.user_favorites.podcasts
     assert podcasts is not None
@@ -1373,8 +1373,7 @@ def test_smoke_get_favorite_podcasts() -> None:
 
 def test_smoke_get_podcast_episode_bookmarks() -> None:
     """Verify GetPodcastEpisodeBookmarks fixture parses with bookmark state."""
-    data = _load_fixture("get_podcast_episode_bookmarks.json")
-    me = GetPodcastEpisodeBookmarks.model_validate(data).me
+    me = _validate_fixture(GetPodcastEpisodeBookmarks, "get_podcast_episode_bookmarks.json").me
     assert me is not None
     bookmarks = me.podcast_episode_bookmarks
     assert len(bookmarks.edges) == 1
@@ -1393,8 +1392,7 @@ def test_smoke_get_podcast_episode_bookmarks() -> None:
 
 def test_smoke_add_podcast_to_favorite() -> None:
     """Verify AddPodcastToFavorite fixture parses with returned podcast."""
-    data = _load_fixture("add_podcast_to_favorite.json")
-    result = AddPodcastToFavorite.model_validate(data)
+    result = _validate_fixture(AddPodcastToFavorite, "add_podcast_to_favorite.json")
     assert result.add_podcast_to_favorite.podcast.id == "1234"
     assert result.add_podcast_to_favorite.podcast.display_title == "Tech Weekly"
     assert result.add_podcast_to_favorite.favorited_at == "2025-07-10"
@@ -1402,16 +1400,14 @@ def test_smoke_add_podcast_to_favorite() -> None:
 
 def test_smoke_remove_podcast_from_favorite() -> None:
     """Verify RemovePodcastFromFavorite fixture parses with returned podcast."""
-    data = _load_fixture("remove_podcast_from_favorite.json")
-    result = RemovePodcastFromFavorite.model_validate(data)
+    result = _validate_fixture(RemovePodcastFromFavorite, "remove_podcast_from_favorite.json")
     assert result.remove_podcast_from_favorite.podcast is not None
     assert result.remove_podcast_from_favorite.podcast.id == "1234"
 
 
 def test_smoke_bookmark_podcast_episode() -> None:
     """Verify BookmarkPodcastEpisode fixture parses with bookmark state."""
-    data = _load_fixture("bookmark_podcast_episode.json")
-    result = BookmarkPodcastEpisode.model_validate(data)
+    result = _validate_fixture(BookmarkPodcastEpisode, "bookmark_podcast_episode.json")
     assert result.bookmark_podcast_episode.status is True
     assert result.bookmark_podcast_episode.bookmark is not None
     assert result.bookmark_podcast_episode.bookmark.position == 600
@@ -1419,16 +1415,14 @@ def test_smoke_bookmark_podcast_episode() -> None:
 
 def test_smoke_unbookmark_podcast_episode() -> None:
     """Verify UnbookmarkPodcastEpisode fixture parses with episode."""
-    data = _load_fixture("unbookmark_podcast_episode.json")
-    result = UnbookmarkPodcastEpisode.model_validate(data)
+    result = _validate_fixture(UnbookmarkPodcastEpisode, "unbookmark_podcast_episode.json")
     assert result.unbookmark_podcast_episode.status is True
     assert result.unbookmark_podcast_episode.episode.id == "ep_100"
 
 
 def test_smoke_mark_as_played_podcast_episode() -> None:
     """Verify MarkAsPlayedPodcastEpisode fixture parses with bookmark state."""
-    data = _load_fixture("mark_as_played_podcast_episode.json")
-    result = MarkAsPlayedPodcastEpisode.model_validate(data)
+    result = _validate_fixture(MarkAsPlayedPodcastEpisode, "mark_as_played_podcast_episode.json")
     assert result.mark_as_played_podcast_episode.status is True
     assert result.mark_as_played_podcast_episode.bookmark is not None
     assert result.mark_as_played_podcast_episode.bookmark.is_played is True
@@ -1436,8 +1430,9 @@ def test_smoke_mark_as_played_podcast_episode() -> None:
 
 def test_smoke_mark_as_not_played_podcast_episode() -> None:
     """Verify MarkAsNotPlayedPodcastEpisode fixture parses with episode."""
-    data = _load_fixture("mark_as_not_played_podcast_episode.json")
-    result = MarkAsNotPlayedPodcastEpisode.model_validate(data)
+    result = _validate_fixture(
+        MarkAsNotPlayedPodcastEpisode, "mark_as_not_played_podcast_episode.json"
+    )
     assert result.mark_as_not_played_podcast_episode.status is True
     assert result.mark_as_not_played_podcast_episode.episode.id == "ep_100"
 
@@ -1449,8 +1444,7 @@ def test_smoke_mark_as_not_played_podcast_episode() -> None:
 
 def test_smoke_get_artist_mix() -> None:
     """Verify GetArtistMix fixture parses with track results."""
-    data = _load_fixture("get_artist_mix.json")
-    mix = GetArtistMix.model_validate(data).artist_mix
+    mix = _validate_fixture(GetArtistMix, "get_artist_mix.json").artist_mix
     assert mix is not None
     assert len(mix.tracks) == 2
     track = mix.tracks[0].track
@@ -1463,8 +1457,7 @@ def test_smoke_get_artist_mix() -> None:
 
 def test_smoke_get_track_mix() -> None:
     """Verify GetTrackMix fixture parses with track results."""
-    data = _load_fixture("get_track_mix.json")
-    mix = GetTrackMix.model_validate(data).track_mix
+    mix = _validate_fixture(GetTrackMix, "get_track_mix.json").track_mix
     assert mix is not None
     assert len(mix.tracks) == 2
     track = mix.tracks[1].track
@@ -1481,8 +1474,7 @@ def test_smoke_get_track_mix() -> None:
 
 def test_smoke_get_audiobook() -> None:
     """Verify GetAudiobook fixture parses with chapters and contributors."""
-    data = _load_fixture("get_audiobook.json")
-    audiobook = GetAudiobook.model_validate(data).audiobook
+    audiobook = _validate_fixture(GetAudiobook, "get_audiobook.json").audiobook
     assert audiobook is not None
     assert audiobook.id == "ab_1001"
     assert audiobook.display_title == "The Art of War"
@@ -1506,8 +1498,7 @@ def test_smoke_get_audiobook() -> None:
 
 def test_smoke_get_audiobook_chapter() -> None:
     """Verify GetAudiobookChapter fixture parses with media and audiobook."""
-    data = _load_fixture("get_audiobook_chapter.json")
-    chapter = GetAudiobookChapter.model_validate(data).audiobook_chapter
+    chapter = _validate_fixture(GetAudiobookChapter, "get_audiobook_chapter.json").audiobook_chapter
     assert chapter is not None
     assert chapter.id == "ch_001"
     assert chapter.display_title == "Chapter 1: Laying Plans"
@@ -1523,8 +1514,7 @@ def test_smoke_get_audiobook_chapter() -> None:
 
 def test_smoke_get_similar_tracks() -> None:
     """Verify GetSimilarTracks fixture parses with TrackFields."""
-    data = _load_fixture("get_similar_tracks.json")
-    track = GetSimilarTracks.model_validate(data).track
+    track = _validate_fixture(GetSimilarTracks, "get_similar_tracks.json").track
     assert track is not None
     recs = [t for t in track.recommended_tracks if t is not None]
     assert len(recs) == 3
@@ -1537,8 +1527,7 @@ def test_smoke_get_similar_tracks() -> None:
 
 def test_smoke_get_similar_artists() -> None:
     """Verify GetSimilarArtists fixture parses with ArtistFields."""
-    data = _load_fixture("get_similar_artists.json")
-    artist = GetSimilarArtists.model_validate(data).artist
+    artist = _validate_fixture(GetSimilarArtists, "get_similar_artists.json").artist
     assert artist is not None
     assert artist.related_artist is not None
     nodes = [e.node for e in artist.related_artist.edges if e.node is not None]
@@ -1553,8 +1542,7 @@ def test_smoke_get_similar_artists() -> None:
 
 def test_smoke_get_favorite_audiobooks() -> None:
     """Verify GetFavoriteAudiobooks fixture parses with raw audiobook IDs."""
-    data = _load_fixture("get_favorite_audiobooks.json")
-    me = GetFavoriteAudiobooks.model_validate(data).me
+    me = _validate_fixture(GetFavoriteAudiobooks, "get_favorite_audiobooks.json").me
     assert me is not None
     raw = me.favorites.raw_audiobooks
     assert raw is not None
@@ -1566,16 +1554,14 @@ def test_smoke_get_favorite_audiobooks() -> None:
 
 def test_smoke_add_audiobook_to_favorite() -> None:
     """Verify AddAudiobookToFavorite fixture parses."""
-    data = _load_fixture("add_audiobook_to_favorite.json")
-    result = AddAudiobookToFavorite.model_validate(data)
+    result = _validate_fixture(AddAudiobookToFavorite, "add_audiobook_to_favorite.json")
     assert result.add_audiobook_to_favorite.id == "ab_1001"
     assert result.add_audiobook_to_favorite.favorited_at
 
 
 def test_smoke_remove_audiobook_from_favorite() -> None:
     """Verify RemoveAudiobookFromFavorite fixture parses."""
-    data = _load_fixture("remove_audiobook_from_favorite.json")
-    result = RemoveAudiobookFromFavorite.model_validate(data)
+    result = _validate_fixture(RemoveAudiobookFromFavorite, "remove_audiobook_from_favorite.json")
     assert result.remove_audiobook_from_favorite.id == "ab_1001"
 
 
@@ -1586,8 +1572,7 @@ def test_smoke_remove_audiobook_from_favorite() -> None:
 
 def test_smoke_get_music_together_groups() -> None:
     """Verify GetMusicTogetherGroups fixture parses with group list."""
-    data = _load_fixture("get_music_together_groups.json")
-    me = GetMusicTogetherGroups.model_validate(data).me
+    me = _validate_fixture(GetMusicTogetherGroups, "get_music_together_groups.json").me
     assert me is not None
     assert me.music_together_group_count == 2
     groups = me.music_together_groups
@@ -1607,8 +1592,9 @@ def test_smoke_get_music_together_groups() -> None:
 
 def test_smoke_get_music_together_group() -> None:
     """Verify GetMusicTogetherGroup fixture parses with members and tracklists."""
-    data = _load_fixture("get_music_together_group.json")
-    group = GetMusicTogetherGroup.model_validate(data).music_together_group
+    group = _validate_fixture(
+        GetMusicTogetherGroup, "get_music_together_group.json"
+    ).music_together_group
     assert group is not None
     assert group.id == "mt_group_001"
     assert group.name == "Road Trip Vibes"
@@ -1640,8 +1626,9 @@ def test_smoke_get_music_together_group() -> None:
 
 def test_smoke_get_music_together_affinity() -> None:
     """Verify GetMusicTogetherAffinity fixture parses with discovery content."""
-    data = _load_fixture("get_music_together_affinity.json")
-    affinity = GetMusicTogetherAffinity.model_validate(data).music_together_affinity
+    affinity = _validate_fixture(
+        GetMusicTogetherAffinity, "get_music_together_affinity.json"
+    ).music_together_affinity
     assert affinity is not None
     assert affinity.compatibility_score == 85
     assert affinity.member.name == "Bob"
@@ -1655,8 +1642,7 @@ def test_smoke_get_music_together_affinity() -> None:
 
 def test_smoke_music_together_create_group() -> None:
     """Verify MusicTogetherCreateGroup fixture parses the success variant."""
-    data = _load_fixture("music_together_create_group.json")
-    result = MusicTogetherCreateGroup.model_validate(data)
+    result = _validate_fixture(MusicTogetherCreateGroup, "music_together_create_group.json")
     output = result.music_together_create_group
     assert output.typename__ == "MusicTogetherCreateGroupOutput"
     assert output.group.id == "mt_group_new"
@@ -1665,8 +1651,7 @@ def test_smoke_music_together_create_group() -> None:
 
 def test_smoke_music_together_join_group() -> None:
     """Verify MusicTogetherJoinGroup fixture parses the success variant."""
-    data = _load_fixture("music_together_join_group.json")
-    result = MusicTogetherJoinGroup.model_validate(data)
+    result = _validate_fixture(MusicTogetherJoinGroup, "music_together_join_group.json")
     output = result.music_together_join_group
     assert output.typename__ == "MusicTogetherJoinGroupOutput"
     assert output.group.estimated_members_count == 4
@@ -1674,8 +1659,7 @@ def test_smoke_music_together_join_group() -> None:
 
 def test_smoke_music_together_leave_group() -> None:
     """Verify MusicTogetherLeaveGroup fixture parses the success variant."""
-    data = _load_fixture("music_together_leave_group.json")
-    result = MusicTogetherLeaveGroup.model_validate(data)
+    result = _validate_fixture(MusicTogetherLeaveGroup, "music_together_leave_group.json")
     output = result.music_together_leave_group
     assert output.typename__ == "MusicTogetherLeaveGroupOutput"
     assert output.group is not None
@@ -1684,6 +1668,7 @@ def test_smoke_music_together_leave_group() -> None:
 
 def test_smoke_music_together_generate_group_name() -> None:
     """Verify MusicTogetherGenerateGroupName fixture parses."""
-    data = _load_fixture("music_together_generate_group_name.json")
-    result = MusicTogetherGenerateGroupName.model_validate(data)
+    result = _validate_fixture(
+        MusicTogetherGenerateGroupName, "music_together_generate_group_name.json"
+    )
     assert result.music_together_generate_group_name.name == "Sunset Harmonies"
@@ -0,0 +1,54 @@
+"""Tests for the introspection-to-SDL conversion in scripts/convert_schema.py.
+
+The direct SDL emitter must stay in sync with graphql-core's print_schema.
+"""
+
+from __future__ import annotations
+
+import copy
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+import pytest
+from graphql import build_client_schema, build_schema, introspection_from_schema, print_schema
+
+from scripts.convert_schema import emit_sdl, fix_introspection, load_introspection
+
+if TYPE_CHECKING:
+    from graphql import IntrospectionQuery
+
+SCHEMA_JSON = Path(__file__).resolve().parent.parent / "schema.json"
+
+
+def _print_schema(introspection: dict[str, Any]) -> str:
+    """Render introspection via graphql-core's build_client_schema + print_schema."""
+    return print_schema(build_client_schema(cast("IntrospectionQuery", introspection)))
+
+
+def test_emit_sdl_matches_print_schema() -> None:
+    """The emitter reproduces print_schema for the checked-in Deezer schema."""
+    introspection = load_introspection(SCHEMA_JSON)
+    fix_introspection(introspection)
+    expected = _print_schema(copy.deepcopy(introspection))
+    assert emit_sdl(introspection) == expected
+
+
+@pytest.mark.parametrize(
+    ("arg_type", "default"),
+    [
+        ("[Int!]", "[1,2]"),
+        ("[Int!]", "[ 1 , 2 ]"),
+        ("String", '"a\\u0062c"'),
+        ("Filter", '{limit:5,tags:["x"]}'),
+    ],
+)
+def test_emit_sdl_normalizes_default_values(arg_type: str, default: str) -> None:
+    """Default values are re-printed like print_schema, whatever their raw formatting."""
+    schema = build_schema(
+        "input Filter { limit: Int tags: [String!] }\n"
+        f"type Query {{ search(arg: {arg_type}): String }}"
+    )
+    introspection = cast("dict[str, Any]", introspection_from_schema(schema))
+    query_type = next(t for t in introspection["__schema"]["types"] if t["name"] == "Query")
+    query_type["fields"][0]["args"][0]["defaultValue"] = default
+    assert emit_sdl(introspection) == _print_schema(introspection)